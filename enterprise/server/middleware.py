@@ -18,6 +18,25 @@ from openhands.app_server.user_auth.user_auth import AuthType, UserAuth, get_use
 from openhands.app_server.utils.logger import openhands_logger as logger
 
 
+# Paths that never require the auth cookie; checked on every request, so kept
+# as a frozenset for constant-time lookups.
+_AUTH_IGNORE_PATHS = frozenset(
+    {
+        '/api/options/config',
+        '/api/keycloak/callback',
+        '/api/billing/success',
+        '/api/billing/cancel',
+        '/api/billing/customer-setup-success',
+        '/api/billing/stripe-webhook',
+        '/api/email/resend',
+        '/api/organizations/members/invite/accept',
+        '/oauth/device/authorize',
+        '/oauth/device/token',
+        '/api/v1/web-client/config',
+    }
+)
+
+
 class SetAuthCookieMiddleware:
     """
     Update the auth cookie with the current authentication state if it was refreshed before sending response to user.
@@ -149,26 +168,11 @@ class SetAuthCookieMiddleware:
             return False
         path = request.url.path
 
-        ignore_paths = (
-            '/api/options/config',
-            '/api/keycloak/callback',
-            '/api/billing/success',
-            '/api/billing/cancel',
-            '/api/billing/customer-setup-success',
-            '/api/billing/stripe-webhook',
-            '/api/email/resend',
-            '/api/organizations/members/invite/accept',
-            '/oauth/device/authorize',
-            '/oauth/device/token',
-            '/api/v1/web-client/config',
-        )
-        if path in ignore_paths:
+        if path in _AUTH_IGNORE_PATHS:
             return False
 
         # Allow public access to shared conversations and events
-        if path.startswith('/api/shared-conversations') or path.startswith(
-            '/api/shared-events'
-        ):
+        if path.startswith(('/api/shared-conversations', '/api/shared-events')):
             return False
 
         # Webhooks access is controlled using separate API keys
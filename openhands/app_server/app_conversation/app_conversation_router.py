@@ -79,6 +79,7 @@ from openhands.app_server.settings.settings_router import LITE_LLM_API_URL
 from openhands.app_server.user.specifiy_user_context import USER_CONTEXT_ATTR
 from openhands.app_server.user.user_context import UserContext
 from openhands.app_server.user_auth import get_user_settings
+from openhands.app_server.utils.async_utils import create_background_task
 from openhands.app_server.utils.dependencies import get_dependencies
 from openhands.app_server.utils.docker_utils import (
     replace_localhost_hostname_for_docker,
@@ -398,7 +399,7 @@ async def start_app_conversation(
         except Exception:
             logger.exception('analytics:conversation_created:failed')
 
-        asyncio.create_task(_consume_remaining(async_iter, db_session, httpx_client))
+        create_background_task(_consume_remaining(async_iter, db_session, httpx_client))
         return result
     except Exception:
         await db_session.close()
@@ -853,7 +854,7 @@ async def delete_app_conversation(
 
     # Delete the sandbox in the background if no other conversations reference it
     if sandbox_id:
-        asyncio.create_task(
+        create_background_task(
             _finalize_sandbox_delete(
                 sandbox_service,
                 app_conversation_info_service,
@@ -1208,9 +1209,10 @@ async def get_conversation_hooks(
         # Load hooks from agent-server (using the error-raising variant so
         # HTTP/connection failures are surfaced to the user, not hidden).
         logger.debug(
-            f'Loading hooks for conversation {conversation_id}, '
-            f'agent_server_url={ctx.agent_server_url}, '
-            f'project_dir={project_dir}'
+            'Loading hooks for conversation %s, agent_server_url=%s, project_dir=%s',
+            conversation_id,
+            ctx.agent_server_url,
+            project_dir,
         )
 
         try:
@@ -1285,7 +1287,9 @@ async def get_conversation_hooks(
                     )
 
         logger.debug(
-            f'Loaded {len(hooks_response)} hook event types for conversation {conversation_id}'
+            'Loaded %d hook event types for conversation %s',
+            len(hooks_response),
+            conversation_id,
         )
 
         return JSONResponse(
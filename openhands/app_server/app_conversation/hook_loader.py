@@ -66,8 +66,9 @@ async def fetch_hooks_from_agent_server(
         httpx.RequestError: If the agent-server is unreachable.
     """
     _logger.debug(
-        f'fetch_hooks_from_agent_server called: '
-        f'agent_server_url={agent_server_url}, project_dir={project_dir}'
+        'fetch_hooks_from_agent_server called: agent_server_url=%s, project_dir=%s',
+        agent_server_url,
+        project_dir,
     )
     payload = {'project_dir': project_dir}
 
@@ -96,7 +97,7 @@ async def fetch_hooks_from_agent_server(
         _logger.debug('Hooks config is empty')
         return None
 
-    _logger.debug(f'Loaded hooks from agent-server for {project_dir}')
+    _logger.debug('Loaded hooks from agent-server for %s', project_dir)
     return hook_config
 
 
@@ -1,7 +1,5 @@
 import asyncio
-import json
 import logging
-import os
 import tempfile
 import zipfile
 from collections import defaultdict
@@ -1413,16 +1411,20 @@ class LiveStatusAppConversationService(AppConversationServiceBase):
 
             try:
                 _logger.debug(
-                    f'Attempting to load hooks from workspace: '
-                    f'project_dir={project_dir}'
+                    'Attempting to load hooks from workspace: project_dir=%s',
+                    project_dir,
                 )
                 hook_config = await self._load_hooks_from_workspace(
                     remote_workspace, project_dir
                 )
                 if hook_config:
-                    _logger.debug(
-                        f'Successfully loaded hooks: {sanitize_config(hook_config.model_dump())}'
-                    )
+                    # Dumping and sanitizing the config is only worth it when
+                    # debug logging is actually enabled.
+                    if _logger.isEnabledFor(logging.DEBUG):
+                        _logger.debug(
+                            'Successfully loaded hooks: %s',
+                            sanitize_config(hook_config.model_dump()),
+                        )
                 else:
                     _logger.debug('No hooks found in workspace')
             except Exception as e:
@@ -1687,7 +1689,7 @@ class LiveStatusAppConversationService(AppConversationServiceBase):
                     timeout=30.0,
                 )
                 response.raise_for_status()
-                _logger.debug(f'Delivered pending message {msg.id}')
+                _logger.debug('Delivered pending message %s', msg.id)
             except Exception as e:
                 _logger.warning(f'Failed to deliver pending message {msg.id}: {e}')
 
@@ -2003,43 +2005,26 @@ class LiveStatusAppConversationService(AppConversationServiceBase):
         if not conversation_info:
             raise ValueError(f'Conversation not found: {conversation_id}')
 
-        # Create a temporary directory to store files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Get all events for this conversation
-            i = 0
-            async for event in page_iterator(
-                self.event_service.search_events, conversation_id=conversation_id
-            ):
-                event_filename = f'event_{i:06d}_{event.id}.json'
-                event_path = os.path.join(temp_dir, event_filename)
-
-                with open(event_path, 'w') as f:
-                    # Use model_dump with mode='json' to handle UUID serialization
-                    event_data = event.model_dump(mode='json')
-                    json.dump(event_data, f, indent=2)
-                i += 1
-
-            # Create meta.json with conversation info
-            meta_path = os.path.join(temp_dir, 'meta.json')
-            with open(meta_path, 'w') as f:
-                f.write(conversation_info.model_dump_json(indent=2))
-
-            # Create zip file in memory
-            zip_buffer = tempfile.NamedTemporaryFile()
+        # Stream each event straight into the archive rather than staging every
+        # file in a temporary directory first, so only one serialized event is
+        # held at a time and nothing is written or read twice.
+        with tempfile.TemporaryFile() as zip_buffer:
             with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add all files from temp directory to zip
-                for root, dirs, files in os.walk(temp_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, temp_dir)
-                        zipf.write(file_path, arcname)
+                # Get all events for this conversation
+                i = 0
+                async for event in page_iterator(
+                    self.event_service.search_events, conversation_id=conversation_id
+                ):
+                    event_filename = f'event_{i:06d}_{event.id}.json'
+                    zipf.writestr(event_filename, event.model_dump_json(indent=2))
+                    i += 1
+
+                # Add meta.json with conversation info
+                zipf.writestr('meta.json', conversation_info.model_dump_json(indent=2))
 
             # Read the zip file content
             zip_buffer.seek(0)
-            zip_content = zip_buffer.read()
-            zip_buffer.close()
-
-            return zip_content
+            return zip_buffer.read()
 
 
 class LiveStatusAppConversationServiceInjector(AppConversationServiceInjector):
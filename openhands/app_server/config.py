@@ -151,9 +151,7 @@ def resolve_provider_llm_base_url(
         provider_base_url: Deployment provider URL.  Falls back to
             ``get_openhands_provider_base_url()`` when *None*.
     """
-    if not model or not (
-        model.startswith('openhands/') or model.startswith('litellm_proxy/')
-    ):
+    if not model or not model.startswith(('openhands/', 'litellm_proxy/')):
         return base_url
 
     user_set_custom = base_url and base_url.rstrip('/') != _SDK_DEFAULT_PROXY.rstrip(
@@ -142,7 +142,10 @@ class DefaultLLMModelService(LLMModelService):
             except httpx.HTTPError as e:
                 _logger.error(f'Error getting OLLAMA models: {e}')
 
-        self._cached_response = get_supported_llm_models(
+        # Resolving providers for the LiteLLM catalogue is CPU-bound, so keep
+        # it off the event loop alongside the Bedrock lookup above.
+        self._cached_response = await call_sync_from_async(
+            get_supported_llm_models,
             verified_models=verified_models,
             extra_models=extra_models or None,
         )
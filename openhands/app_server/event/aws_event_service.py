@@ -3,7 +3,6 @@
 This implementation uses role-based authentication (no credentials needed).
 """
 
-import json
 import logging
 import os
 from dataclasses import dataclass
@@ -39,7 +38,7 @@ class AwsEventService(EventServiceBase):
         try:
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=str(path))
             with response['Body'] as stream:
-                json_data = stream.read().decode('utf-8')
+                json_data = stream.read()
             event = Event.model_validate_json(json_data)
             return event
         except botocore.exceptions.ClientError as e:
@@ -53,8 +52,7 @@ class AwsEventService(EventServiceBase):
 
     def _store_event(self, path: Path, event: Event):
         """Store the event given at the path given."""
-        data = event.model_dump(mode='json')
-        json_str = json.dumps(data, indent=2)
+        json_str = event.model_dump_json(indent=2)
         self.s3_client.put_object(
             Bucket=self.bucket_name,
             Key=str(path),
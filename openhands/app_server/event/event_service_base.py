@@ -18,6 +18,10 @@ from openhands.app_server.event_callback.event_callback_models import EventKind
 from openhands.sdk import Event
 from openhands.sdk.utils.paging import page_iterator
 
+# Upper bound on event files loaded concurrently per search, so a single large
+# conversation does not queue one executor job per event file at once.
+_MAX_CONCURRENT_EVENT_LOADS = 16
+
 
 @dataclass
 class EventServiceBase(EventService, ABC):
@@ -87,10 +91,14 @@ class EventServiceBase(EventService, ABC):
         prefix = await self.get_conversation_path(conversation_id)
         paths = await loop.run_in_executor(None, self._search_paths, prefix)
 
-        # Type error: run_in_executor expects a return value, but self._load_event is typed return Event | None.
-        events = await asyncio.gather(
-            *[loop.run_in_executor(None, self._load_event, path) for path in paths]  # type: ignore[arg-type]
-        )
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_EVENT_LOADS)
+
+        async def load_event(path: Path) -> Event | None:
+            async with semaphore:
+                # Type error: run_in_executor expects a return value, but self._load_event is typed return Event | None.
+                return await loop.run_in_executor(None, self._load_event, path)  # type: ignore[arg-type]
+
+        events = await asyncio.gather(*[load_event(path) for path in paths])
         items = []
         for event in events:
             if not event:
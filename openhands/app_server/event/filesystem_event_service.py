@@ -22,9 +22,9 @@ class FilesystemEventService(EventServiceBase):
 
     def _load_event(self, path: Path) -> Event | None:
         try:
-            content = path.read_text()
-            content = Event.model_validate_json(content)  # type: ignore[assignment]
-            return content  # type: ignore[return-value]
+            # Validate straight from the raw bytes so pydantic-core parses the
+            # JSON without an intermediate str decode.
+            return Event.model_validate_json(path.read_bytes())
         except Exception:
             if path.exists():
                 _logger.exception('Error reading event', stack_info=True)
@@ -1,6 +1,5 @@
 """Google Cloud Storage-based EventService implementation."""
 
-import json
 import logging
 from dataclasses import dataclass
 from functools import lru_cache
@@ -44,7 +43,7 @@ class GoogleCloudEventService(EventServiceBase):
         """Get the event at the path given."""
         blob: Blob = self.bucket.blob(str(path))
         try:
-            with blob.open('r') as f:
+            with blob.open('rb') as f:
                 json_data = f.read()
             event = Event.model_validate_json(json_data)
             return event
@@ -57,9 +56,8 @@ class GoogleCloudEventService(EventServiceBase):
     def _store_event(self, path: Path, event: Event):
         """Store the event given at the path given."""
         blob: Blob = self.bucket.blob(str(path))
-        data = event.model_dump(mode='json')
         with blob.open('w') as f:
-            f.write(json.dumps(data, indent=2))
+            f.write(event.model_dump_json(indent=2))
 
     def _search_paths(self, prefix: Path, page_id: str | None = None) -> list[Path]:
         """Search paths."""
@@ -57,11 +57,14 @@ class LoggingCallbackProcessor(EventCallbackProcessor):
         callback: EventCallback,
         event: Event,
     ) -> EventCallbackResult:
-        _logger.info(
-            'Callback %s Invoked for event %s',
-            callback.id,
-            redact_text_secrets(str(event)),
-        )
+        # Rendering and redacting the event is the expensive part, so skip it
+        # entirely when the record would be filtered out anyway.
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info(
+                'Callback %s Invoked for event %s',
+                callback.id,
+                redact_text_secrets(str(event)),
+            )
         return EventCallbackResult(
             status=EventCallbackResultStatus.SUCCESS,
             event_callback_id=callback.id,
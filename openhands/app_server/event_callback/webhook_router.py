@@ -50,6 +50,7 @@ from openhands.app_server.user_auth.default_user_auth import DefaultUserAuth
 from openhands.app_server.user_auth.user_auth import (
     get_for_user as get_user_auth_for_user,
 )
+from openhands.app_server.utils.async_utils import create_background_task
 from openhands.sdk import ConversationExecutionStatus, Event
 from openhands.sdk.event import ConversationStateUpdateEvent
 
@@ -401,21 +402,23 @@ async def on_event(
             *[event_service.save_event(conversation_id, event) for event in events]
         )
 
-        # Process stats events for V1 conversations
+        # Process stats events for V1 conversations, collecting execution status
+        # updates in the same pass so the batch is only type-checked once.
+        execution_statuses = []
         for event in events:
-            if isinstance(event, ConversationStateUpdateEvent) and event.key == 'stats':
+            if not isinstance(event, ConversationStateUpdateEvent):
+                continue
+            if event.key == 'stats':
                 await app_conversation_info_service.process_stats_event(
                     event, conversation_id
                 )
+            elif event.key == 'execution_status':
+                execution_statuses.append(event.value)
 
         # Analytics: conversation terminal state detection
-        for event in events:
-            if not isinstance(event, ConversationStateUpdateEvent):
-                continue
-            if event.key != 'execution_status':
-                continue
+        for value in execution_statuses:
             try:
-                exec_status = ConversationExecutionStatus(event.value)
+                exec_status = ConversationExecutionStatus(value)
                 if exec_status.is_terminal():
                     await _track_conversation_terminal(
                         conversation_id, app_conversation_info, events, exec_status
@@ -423,7 +426,7 @@ async def on_event(
             except Exception:
                 _logger.exception('analytics:conversation_terminal:failed')
 
-        asyncio.create_task(
+        create_background_task(
             _run_callbacks_in_bg_and_close(
                 conversation_id, app_conversation_info.created_by_user_id, events
             )
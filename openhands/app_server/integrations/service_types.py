@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Protocol
 
 from jinja2 import Environment, FileSystemLoader
@@ -36,6 +37,69 @@ class OwnerType(str, Enum):
     ORGANIZATION = 'organization'
 
 
+_PROVIDER_TERMS: dict[ProviderType, dict[str, str]] = {
+    ProviderType.GITHUB: {
+        'requestType': 'Pull Request',
+        'requestTypeShort': 'PR',
+        'apiName': 'GitHub API',
+        'tokenEnvVar': 'GITHUB_TOKEN',
+        'ciSystem': 'GitHub Actions',
+        'ciProvider': 'GitHub',
+        'requestVerb': 'pull request',
+    },
+    ProviderType.GITLAB: {
+        'requestType': 'Merge Request',
+        'requestTypeShort': 'MR',
+        'apiName': 'GitLab API',
+        'tokenEnvVar': 'GITLAB_TOKEN',
+        'ciSystem': 'CI pipelines',
+        'ciProvider': 'GitLab',
+        'requestVerb': 'merge request',
+    },
+    ProviderType.BITBUCKET: {
+        'requestType': 'Pull Request',
+        'requestTypeShort': 'PR',
+        'apiName': 'Bitbucket API',
+        'tokenEnvVar': 'BITBUCKET_TOKEN',
+        'ciSystem': 'Bitbucket Pipelines',
+        'ciProvider': 'Bitbucket',
+        'requestVerb': 'pull request',
+    },
+    ProviderType.BITBUCKET_DATA_CENTER: {
+        'requestType': 'Pull Request',
+        'requestTypeShort': 'PR',
+        'apiName': 'Bitbucket Data Center API',
+        'tokenEnvVar': 'BITBUCKET_DATA_CENTER_TOKEN',
+        'ciSystem': 'Bitbucket Pipelines',
+        'ciProvider': 'Bitbucket Data Center',
+        'requestVerb': 'pull request',
+    },
+}
+
+_TASK_PROMPT_TEMPLATES: dict[TaskType, str] = {
+    TaskType.MERGE_CONFLICTS: 'merge_conflict_prompt.j2',
+    TaskType.FAILING_CHECKS: 'failing_checks_prompt.j2',
+    TaskType.UNRESOLVED_COMMENTS: 'unresolved_comments_prompt.j2',
+    TaskType.OPEN_ISSUE: 'open_issue_prompt.j2',
+}
+
+
+@lru_cache(maxsize=1)
+def _get_suggested_task_env() -> Environment:
+    """Return a shared Jinja environment for the suggested task prompts.
+
+    The templates ship with the package and never change at runtime, so a single
+    environment is kept (and its compiled templates cached) instead of building a
+    new loader for every prompt.
+    """
+    return Environment(
+        loader=FileSystemLoader(
+            'openhands/app_server/integrations/templates/suggested_task'
+        ),
+        auto_reload=False,
+    )
+
+
 class SuggestedTask(BaseModel):
     git_provider: ProviderType
     task_type: TaskType
@@ -44,48 +108,10 @@ class SuggestedTask(BaseModel):
     title: str
 
     def get_provider_terms(self) -> dict:
-        if self.git_provider == ProviderType.GITHUB:
-            return {
-                'requestType': 'Pull Request',
-                'requestTypeShort': 'PR',
-                'apiName': 'GitHub API',
-                'tokenEnvVar': 'GITHUB_TOKEN',
-                'ciSystem': 'GitHub Actions',
-                'ciProvider': 'GitHub',
-                'requestVerb': 'pull request',
-            }
-        elif self.git_provider == ProviderType.GITLAB:
-            return {
-                'requestType': 'Merge Request',
-                'requestTypeShort': 'MR',
-                'apiName': 'GitLab API',
-                'tokenEnvVar': 'GITLAB_TOKEN',
-                'ciSystem': 'CI pipelines',
-                'ciProvider': 'GitLab',
-                'requestVerb': 'merge request',
-            }
-        elif self.git_provider == ProviderType.BITBUCKET:
-            return {
-                'requestType': 'Pull Request',
-                'requestTypeShort': 'PR',
-                'apiName': 'Bitbucket API',
-                'tokenEnvVar': 'BITBUCKET_TOKEN',
-                'ciSystem': 'Bitbucket Pipelines',
-                'ciProvider': 'Bitbucket',
-                'requestVerb': 'pull request',
-            }
-        elif self.git_provider == ProviderType.BITBUCKET_DATA_CENTER:
-            return {
-                'requestType': 'Pull Request',
-                'requestTypeShort': 'PR',
-                'apiName': 'Bitbucket Data Center API',
-                'tokenEnvVar': 'BITBUCKET_DATA_CENTER_TOKEN',
-                'ciSystem': 'Bitbucket Pipelines',
-                'ciProvider': 'Bitbucket Data Center',
-                'requestVerb': 'pull request',
-            }
-
-        raise ValueError(f'Provider {self.git_provider} for suggested task prompts')
+        terms = _PROVIDER_TERMS.get(self.git_provider)
+        if terms is None:
+            raise ValueError(f'Provider {self.git_provider} for suggested task prompts')
+        return dict(terms)
 
     def get_prompt_for_task(
         self,
@@ -94,23 +120,12 @@ class SuggestedTask(BaseModel):
         issue_number = self.issue_number
         repo = self.repo
 
-        env = Environment(
-            loader=FileSystemLoader(
-                'openhands/app_server/integrations/templates/suggested_task'
-            )
-        )
-
-        template = None
-        if task_type == TaskType.MERGE_CONFLICTS:
-            template = env.get_template('merge_conflict_prompt.j2')
-        elif task_type == TaskType.FAILING_CHECKS:
-            template = env.get_template('failing_checks_prompt.j2')
-        elif task_type == TaskType.UNRESOLVED_COMMENTS:
-            template = env.get_template('unresolved_comments_prompt.j2')
-        elif task_type == TaskType.OPEN_ISSUE:
-            template = env.get_template('open_issue_prompt.j2')
-        else:
+        env = _get_suggested_task_env()
+
+        template_name = _TASK_PROMPT_TEMPLATES.get(task_type)
+        if template_name is None:
             raise ValueError(f'Unsupported task type: {task_type}')
+        template = env.get_template(template_name)
 
         terms = self.get_provider_terms()
 
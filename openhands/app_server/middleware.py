@@ -1,7 +1,7 @@
 import asyncio
 import logging
-from collections import defaultdict
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict, deque
 from urllib.parse import urlparse
 
 from fastapi import Request
@@ -73,7 +73,7 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
 
 
 class InMemoryRateLimiter:
-    history: dict[str, list[datetime]]
+    history: dict[str, deque[float]]
     requests: int
     seconds: int
     sleep_seconds: int
@@ -82,17 +82,19 @@ class InMemoryRateLimiter:
         self.requests = requests
         self.seconds = seconds
         self.sleep_seconds = sleep_seconds
-        self.history = defaultdict(list)
-        self.sleep_seconds = sleep_seconds
+        self.history = defaultdict(deque)
 
     def _clean_old_requests(self, key: str) -> None:
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=self.seconds)
-        self.history[key] = [ts for ts in self.history[key] if ts > cutoff]
+        cutoff = time.monotonic() - self.seconds
+        # Monotonic timestamps are appended in order, so expired ones are always
+        # at the front and can be dropped without rebuilding the history.
+        history = self.history[key]
+        while history and history[0] <= cutoff:
+            history.popleft()
 
     async def __call__(self, request: Request) -> bool:
         key = request.client.host
-        now = datetime.now()
+        now = time.monotonic()
 
         self._clean_old_requests(key)
 
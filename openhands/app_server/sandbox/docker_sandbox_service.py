@@ -34,6 +34,7 @@ from openhands.app_server.sandbox.sandbox_service import (
 )
 from openhands.app_server.sandbox.sandbox_spec_service import SandboxSpecService
 from openhands.app_server.services.injector import InjectorState
+from openhands.app_server.utils.async_utils import call_sync_from_async
 from openhands.app_server.utils.docker_utils import (
     replace_localhost_hostname_for_docker,
 )
@@ -216,7 +217,9 @@ class DockerSandboxService(SandboxService):
 
         if not container.image.tags:
             _logger.debug(
-                f'Skipping container {container.name!r}: image has no tags (image id: {container.image.id})'
+                'Skipping container %r: image has no tags (image id: %s)',
+                container.name,
+                container.image.id,
             )
             return None
 
@@ -271,8 +274,9 @@ class DockerSandboxService(SandboxService):
                     sandbox_info.status = SandboxStatus.ERROR
                 else:
                     _logger.debug(
-                        f'Sandbox server not yet available (still starting): '
-                        f'{app_server_url} : {exc}'
+                        'Sandbox server not yet available (still starting): %s : %s',
+                        app_server_url,
+                        exc,
                     )
                     sandbox_info.status = SandboxStatus.STARTING
                 sandbox_info.exposed_urls = None
@@ -498,9 +502,13 @@ class DockerSandboxService(SandboxService):
         # Enforce sandbox limits by cleaning up old sandboxes
         await self.pause_old_sandboxes(self.max_num_sandboxes - 1)
 
+        if not sandbox_id.startswith(self.container_name_prefix):
+            return False
+        return await call_sync_from_async(self._resume_container, sandbox_id)
+
+    def _resume_container(self, sandbox_id: str) -> bool:
+        """Unpause or restart a sandbox container."""
         try:
-            if not sandbox_id.startswith(self.container_name_prefix):
-                return False
             container = self.docker_client.containers.get(sandbox_id)
 
             if container.status == 'paused':
@@ -514,9 +522,13 @@ class DockerSandboxService(SandboxService):
 
     async def pause_sandbox(self, sandbox_id: str) -> bool:
         """Pause a running sandbox."""
+        if not sandbox_id.startswith(self.container_name_prefix):
+            return False
+        return await call_sync_from_async(self._pause_container, sandbox_id)
+
+    def _pause_container(self, sandbox_id: str) -> bool:
+        """Pause a sandbox container if it is running."""
         try:
-            if not sandbox_id.startswith(self.container_name_prefix):
-                return False
             container = self.docker_client.containers.get(sandbox_id)
 
             if container.status == 'running':
@@ -528,9 +540,15 @@ class DockerSandboxService(SandboxService):
 
     async def delete_sandbox(self, sandbox_id: str) -> bool:
         """Delete a sandbox."""
+        if not sandbox_id.startswith(self.container_name_prefix):
+            return False
+        # Stopping a container can block for up to its stop timeout, so the
+        # Docker calls run in a worker thread instead of on the event loop.
+        return await call_sync_from_async(self._delete_container, sandbox_id)
+
+    def _delete_container(self, sandbox_id: str) -> bool:
+        """Stop and remove a sandbox container and its workspace volume."""
         try:
-            if not sandbox_id.startswith(self.container_name_prefix):
-                return False
             container = self.docker_client.containers.get(sandbox_id)
 
             # Stop the container if it's running
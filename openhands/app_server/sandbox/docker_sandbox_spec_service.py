@@ -79,7 +79,7 @@ class DockerSandboxSpecServiceInjector(SandboxSpecServiceInjector):
         await asyncio.gather(*[self.pull_spec_if_missing(spec) for spec in self.specs])
 
     async def pull_spec_if_missing(self, spec: SandboxSpecInfo):
-        _logger.debug(f'Checking Docker Image: {spec.id}')
+        _logger.debug('Checking Docker Image: %s', spec.id)
         try:
             docker_client = get_docker_client()
             try:
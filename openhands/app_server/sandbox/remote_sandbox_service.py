@@ -773,7 +773,9 @@ async def poll_agent_servers(api_url: str, api_key: str, sleep_interval: int):
                                 httpx_client=httpx_client,
                             )
                     _logger.debug(
-                        f'Matched {len(runtimes_by_sandbox_id)} Runtimes with {matches} Conversations.'
+                        'Matched %d Runtimes with %d Conversations.',
+                        len(runtimes_by_sandbox_id),
+                        matches,
                     )
 
             except Exception as exc:
@@ -800,7 +802,7 @@ async def refresh_conversation(
 
     Grab ConversationInfo and all events from the agent server and make sure they
     exist in the app server."""
-    _logger.debug(f'Started Refreshing Conversation {app_conversation_info.id}')
+    _logger.debug('Started Refreshing Conversation %s', app_conversation_info.id)
     try:
         url = runtime['url']
 
@@ -862,7 +864,7 @@ async def refresh_conversation(
                     app_conversation_info.id, event
                 )
 
-        _logger.debug(f'Finished Refreshing Conversation {app_conversation_info.id}')
+        _logger.debug('Finished Refreshing Conversation %s', app_conversation_info.id)
 
     except Exception as exc:
         _logger.exception(f'Error Refreshing Conversation: {exc}', stack_info=True)
@@ -143,10 +143,19 @@ class SandboxService(ABC):
             response = await httpx_client.get(url, timeout=5.0)
             return response.is_success
         except Exception as exc:
-            _logger.debug(
-                f'Agent server health check failed for sandbox {sandbox.id}'
-                f'{f" at {url}" if url else ""}: {exc}'
-            )
+            if url:
+                _logger.debug(
+                    'Agent server health check failed for sandbox %s at %s: %s',
+                    sandbox.id,
+                    url,
+                    exc,
+                )
+            else:
+                _logger.debug(
+                    'Agent server health check failed for sandbox %s: %s',
+                    sandbox.id,
+                    exc,
+                )
             return False
 
     def _get_agent_server_url(self, sandbox: SandboxInfo) -> str:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 
+import orjson
+
 from openhands.app_server.file_store.files import FileStore
 from openhands.app_server.secrets.secrets_models import Secrets
 from openhands.app_server.secrets.secrets_store import SecretsStore
@@ -17,7 +18,7 @@ class FileSecretsStore(SecretsStore):
     async def load(self) -> Secrets | None:
         try:
             json_str = await call_sync_from_async(self.file_store.read, self.path)
-            kwargs = json.loads(json_str)
+            kwargs = orjson.loads(json_str)
             provider_tokens = {
                 k: v
                 for k, v in (kwargs.get('provider_tokens') or {}).items()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 
+import orjson
+
 from openhands.app_server.file_store.files import FileStore
 from openhands.app_server.settings.settings_models import Settings
 from openhands.app_server.settings.settings_store import SettingsStore
@@ -17,7 +18,7 @@ class FileSettingsStore(SettingsStore):
     async def load(self) -> Settings | None:
         try:
             json_str = await call_sync_from_async(self.file_store.read, self.path)
-            kwargs = json.loads(json_str)
+            kwargs = orjson.loads(json_str)
             # Seed a Default profile from legacy agent_settings.llm when
             # llm_profiles is absent — pre-llm_profiles settings.json files
             # would otherwise present an empty profiles UI on upgrade.
@@ -5,6 +5,9 @@ from typing import Callable, Coroutine, Iterable
 
 GENERAL_TIMEOUT: int = 15
 EXECUTOR = ThreadPoolExecutor()
+# The event loop only keeps weak references to tasks, so fire-and-forget tasks
+# are held here until they finish to stop them being garbage collected mid-run.
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
 
 
 async def call_sync_from_async(fn: Callable, *args, **kwargs):
@@ -12,12 +15,24 @@ async def call_sync_from_async(fn: Callable, *args, **kwargs):
     and awaiting the result. The nature of synchronous code is that the future
     returned by this function is not cancellable
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     coro = loop.run_in_executor(None, lambda: fn(*args, **kwargs))
     result = await coro
     return result
 
 
+def create_background_task(coro: Coroutine) -> asyncio.Task:
+    """Schedule a coroutine to run in the background without awaiting it.
+
+    A reference to the task is kept until it completes, so callers do not need
+    to hold on to the returned task themselves.
+    """
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+
 def call_async_from_sync(
     corofn: Callable, timeout: float = GENERAL_TIMEOUT, *args, **kwargs
 ):
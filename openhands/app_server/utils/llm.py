@@ -1,4 +1,5 @@
 import warnings
+from functools import lru_cache
 
 from pydantic import BaseModel
 
@@ -67,6 +68,10 @@ _BARE_MISTRAL_MODELS: set[str] = set(_SDK_MISTRAL)
 
 DEFAULT_OPENHANDS_MODEL = 'openhands/claude-opus-4-5-20251101'
 
+# Prefixes routed through the OpenHands LLM proxy, checked in a single
+# ``str.startswith`` call.
+_OPENHANDS_MODEL_PREFIXES = ('openhands/', 'litellm_proxy/')
+
 
 # ---------------------------------------------------------------------------
 # Structured API response returned by ``/api/options/models``.
@@ -103,9 +108,7 @@ def is_openhands_model(model: str | None) -> bool:
         True if the model starts with 'openhands/' or 'litellm_proxy/',
         False otherwise.
     """
-    return bool(
-        model and (model.startswith('openhands/') or model.startswith('litellm_proxy/'))
-    )
+    return bool(model and model.startswith(_OPENHANDS_MODEL_PREFIXES))
 
 
 # Canonical masked placeholder for LLM API keys. Matches pydantic's
@@ -260,6 +263,18 @@ def _derive_verified_models(openhands_models: list[str]) -> list[str]:
     ]
 
 
+@lru_cache(maxsize=1)
+def _get_litellm_models() -> tuple[str, ...]:
+    """Return LiteLLM's built-in catalogue with canonical provider prefixes.
+
+    The catalogue is fixed once litellm is imported, but resolving providers
+    for bare names goes through ``get_llm_provider`` for thousands of entries,
+    so the result is computed once per process rather than once per request.
+    """
+    litellm_model_list = litellm.model_list + list(litellm.model_cost.keys())
+    return tuple(_assign_provider(m) for m in remove_error_modelId(litellm_model_list))
+
+
 def get_supported_llm_models(
     verified_models: list[str] | None = None,
     extra_models: list[str] | None = None,
@@ -281,18 +296,16 @@ def get_supported_llm_models(
         extra_models: Optional list of additional model names to include
             (e.g. from Bedrock or Ollama discovery).
     """
-    litellm_model_list = litellm.model_list + list(litellm.model_cost.keys())
-    model_list = remove_error_modelId(litellm_model_list)
+    model_list = list(_get_litellm_models())
 
     if extra_models:
-        model_list = model_list + extra_models
+        # Assign canonical provider prefixes to bare discovered names.
+        model_list.extend(_assign_provider(m) for m in extra_models)
 
     openhands_models = get_openhands_models(verified_models)
 
-    # Assign canonical provider prefixes to bare LiteLLM names, then dedupe.
-    all_models = (
-        openhands_models + CLARIFAI_MODELS + [_assign_provider(m) for m in model_list]
-    )
+    # Dedupe across all sources.
+    all_models = openhands_models + CLARIFAI_MODELS + model_list
     unique_models = sorted(set(all_models))
 
     return ModelsResponse(
@@ -5,6 +5,7 @@ import re
 import sys
 import traceback
 import warnings
+from collections import deque
 from datetime import datetime
 from logging.handlers import TimedRotatingFileHandler
 from types import TracebackType
@@ -132,6 +133,9 @@ class NoColorFormatter(logging.Formatter):
         return super().format(new_record)
 
 
+_ANSI_ESCAPE_RE = re.compile(r'\x1B\[\d+(;\d+){0,2}m')
+
+
 def strip_ansi(s: str) -> str:
     """Remove ANSI escape sequences (terminal color/formatting codes) from string.
 
@@ -139,9 +143,7 @@ def strip_ansi(s: str) -> str:
     http://www.ecma-international.org/publications/files/ECMA-ST/Ecma-048.pdf
     # https://github.com/ewen-lbh/python-strip-ansi/blob/master/strip_ansi/__init__.py
     """
-    pattern = re.compile(r'\x1B\[\d+(;\d+){0,2}m')
-    stripped = pattern.sub('', s)
-    return stripped
+    return _ANSI_ESCAPE_RE.sub('', s)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -194,13 +196,14 @@ llm_formatter = logging.Formatter('%(message)s')
 class RollingLogger:
     max_lines: int
     char_limit: int
-    log_lines: list[str]
+    log_lines: deque[str]
     all_lines: str
 
     def __init__(self, max_lines: int = 10, char_limit: int = 80) -> None:
         self.max_lines = max_lines
         self.char_limit = char_limit
-        self.log_lines = [''] * self.max_lines
+        # Bounded window: appending drops the oldest line without shifting the rest
+        self.log_lines = deque([''] * self.max_lines, maxlen=self.max_lines)
         self.all_lines = ''
 
     def is_enabled(self) -> bool:
@@ -213,7 +216,6 @@ class RollingLogger:
         self._flush()
 
     def add_line(self, line: str) -> None:
-        self.log_lines.pop(0)
         self.log_lines.append(line[: self.char_limit])
         self.print_lines()
         self.all_lines += line + '\n'
@@ -254,6 +256,34 @@ class RollingLogger:
         sys.stdout.flush()
 
 
+_SENSITIVE_PATTERNS = [
+    'api_key',
+    'aws_access_key_id',
+    'aws_secret_access_key',
+    'e2b_api_key',
+    'github_token',
+    'jwt_secret',
+    'modal_api_token_id',
+    'modal_api_token_secret',
+    'llm_api_key',
+    'sandbox_env_github_token',
+    'runloop_api_key',
+    'daytona_api_key',
+]
+_SENSITIVE_ATTRS = _SENSITIVE_PATTERNS + [a.upper() for a in _SENSITIVE_PATTERNS]
+# Substitutions are applied one attribute at a time, in order, because a value
+# may itself be another attribute's assignment (e.g. github_token=api_key=...)
+# and a single combined pattern would let the outer value swallow it.
+_SENSITIVE_ATTR_SUBS = [
+    (re.compile(rf"{attr}='?([\w-]+)'?"), f"{attr}='******'")
+    for attr in _SENSITIVE_ATTRS
+]
+# One scan to skip the substitutions for the common record with no assignments.
+_SENSITIVE_ATTR_RE = re.compile(
+    '(?:' + '|'.join(re.escape(attr) for attr in _SENSITIVE_ATTRS) + r")='?[\w-]"
+)
+
+
 class SensitiveDataFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         # Gather sensitive values which should not ever appear in the logs.
@@ -273,28 +303,9 @@ class SensitiveDataFilter(logging.Filter):
             msg = msg.replace(sensitive_value, '******')
 
         # Replace obvious sensitive values from log itself...
-        sensitive_patterns = [
-            'api_key',
-            'aws_access_key_id',
-            'aws_secret_access_key',
-            'e2b_api_key',
-            'github_token',
-            'jwt_secret',
-            'modal_api_token_id',
-            'modal_api_token_secret',
-            'llm_api_key',
-            'sandbox_env_github_token',
-            'runloop_api_key',
-            'daytona_api_key',
-        ]
-
-        # add env var names
-        env_vars = [attr.upper() for attr in sensitive_patterns]
-        sensitive_patterns.extend(env_vars)
-
-        for attr in sensitive_patterns:
-            pattern = rf"{attr}='?([\w-]+)'?"
-            msg = re.sub(pattern, f"{attr}='******'", msg)
+        if _SENSITIVE_ATTR_RE.search(msg):
+            for pattern, replacement in _SENSITIVE_ATTR_SUBS:
+                msg = pattern.sub(replacement, msg)
 
         # Apply SDK redaction utils to catch API key literals (e.g. sk_live_,
         # sk-proj-, ghp_, etc.) and secret dict patterns (e.g. 'GITHUB_TOKEN':
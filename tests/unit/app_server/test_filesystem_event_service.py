@@ -4,13 +4,18 @@ This module tests the filesystem-based implementation of EventService,
 focusing on search functionality.
 """
 
+import asyncio
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 
 from openhands.agent_server.models import EventPage, EventSortOrder
+from openhands.app_server.event.event_service_base import _MAX_CONCURRENT_EVENT_LOADS
 from openhands.app_server.event.filesystem_event_service import FilesystemEventService
 from openhands.sdk.event import PauseEvent, TokenEvent
 
@@ -268,6 +273,47 @@ class TestFilesystemEventServiceSearchEvents:
         # Should have found all 5 token events
         assert len(collected_ids) == 5
 
+    @pytest.mark.asyncio
+    async def test_search_events_bounds_concurrent_loads(
+        self, service: FilesystemEventService, monkeypatch
+    ):
+        """Test that search_events never runs more than the limit of loads at once."""
+        conversation_id = uuid4()
+        num_events = _MAX_CONCURRENT_EVENT_LOADS * 2
+        for _ in range(num_events):
+            await service.save_event(conversation_id, create_token_event())
+
+        # Give the executor enough threads that only the semaphore can bound loads
+        executor = ThreadPoolExecutor(max_workers=num_events)
+        asyncio.get_running_loop().set_default_executor(executor)
+
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+        load_event = service._load_event
+
+        def blocking_load_event(path: Path):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            try:
+                time.sleep(0.05)
+                return load_event(path)
+            finally:
+                with lock:
+                    in_flight -= 1
+
+        monkeypatch.setattr(service, '_load_event', blocking_load_event)
+
+        try:
+            result = await service.search_events(conversation_id, limit=num_events)
+        finally:
+            executor.shutdown(wait=False)
+
+        assert len(result.items) == num_events
+        assert max_in_flight <= _MAX_CONCURRENT_EVENT_LOADS
+
 
 class TestFilesystemEventServiceIntegration:
     """Integration tests for FilesystemEventService."""
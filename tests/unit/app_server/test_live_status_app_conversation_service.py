@@ -1271,14 +1271,14 @@ class TestLiveStatusAppConversationService:
         # Mock events
         mock_event1 = Mock(spec=Event)
         mock_event1.id = uuid4()
-        mock_event1.model_dump = Mock(
-            return_value={'id': str(mock_event1.id), 'type': 'action'}
+        mock_event1.model_dump_json = Mock(
+            return_value=json.dumps({'id': str(mock_event1.id), 'type': 'action'})
         )
 
         mock_event2 = Mock(spec=Event)
         mock_event2.id = uuid4()
-        mock_event2.model_dump = Mock(
-            return_value={'id': str(mock_event2.id), 'type': 'observation'}
+        mock_event2.model_dump_json = Mock(
+            return_value=json.dumps({'id': str(mock_event2.id), 'type': 'observation'})
         )
 
         # Mock event service search_events to return paginated results
@@ -1473,11 +1473,13 @@ class TestLiveStatusAppConversationService:
             for i in range(events_per_page):
                 mock_event = Mock(spec=Event)
                 mock_event.id = uuid4()
-                mock_event.model_dump = Mock(
-                    return_value={
-                        'id': str(mock_event.id),
-                        'type': f'event_page_{page_num}_item_{i}',
-                    }
+                mock_event.model_dump_json = Mock(
+                    return_value=json.dumps(
+                        {
+                            'id': str(mock_event.id),
+                            'type': f'event_page_{page_num}_item_{i}',
+                        }
+                    )
                 )
                 page_events.append(mock_event)
                 all_events.append(mock_event)
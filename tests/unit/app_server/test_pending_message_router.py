@@ -7,6 +7,7 @@ focusing on request validation and rate limiting.
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+import orjson
 import pytest
 from fastapi import HTTPException, status
 
@@ -35,7 +36,7 @@ def _make_mock_service(
 def _make_mock_request(body: dict):
     """Create a mock FastAPI Request with given JSON body."""
     request = MagicMock()
-    request.json = AsyncMock(return_value=body)
+    request.body = AsyncMock(return_value=orjson.dumps(body))
     return request
 
 
@@ -113,7 +114,7 @@ class TestQueuePendingMessage:
         conversation_id = f'task-{uuid4().hex}'
         mock_service = _make_mock_service()
         mock_request = MagicMock()
-        mock_request.json = AsyncMock(side_effect=Exception('Invalid JSON'))
+        mock_request.body = AsyncMock(return_value=b'{not valid json')
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -3,9 +3,11 @@ from unittest.mock import patch
 
 from openhands.app_server.utils.logger import (
     RedactURLParamsFilter,
+    RollingLogger,
     SensitiveDataFilter,
     _uvicorn_default_log_config,
     _uvicorn_json_log_config,
+    strip_ansi,
 )
 
 
@@ -122,6 +124,44 @@ def test_sensitive_data_filter_case_sensitivity():
     assert record.msg.count('******') == 3
 
 
+@patch.dict('os.environ', {}, clear=True)
+def test_sensitive_data_filter_redacts_attribute_assignments():
+    filter = SensitiveDataFilter()
+
+    record = logging.LogRecord(
+        name='test_logger',
+        level=logging.INFO,
+        pathname='test.py',
+        lineno=1,
+        msg="llm_api_key=abc-123 GITHUB_TOKEN='ghtok' model=gpt-4o",
+        args=(),
+        exc_info=None,
+    )
+
+    filter.filter(record)
+
+    assert 'abc-123' not in record.msg
+    assert 'ghtok' not in record.msg
+    assert "GITHUB_TOKEN='******'" in record.msg
+    assert 'model=gpt-4o' in record.msg
+
+    # A value that is itself another sensitive assignment must not leak
+    record = logging.LogRecord(
+        name='test_logger',
+        level=logging.INFO,
+        pathname='test.py',
+        lineno=1,
+        msg='github_token=api_key=sk-secret',
+        args=(),
+        exc_info=None,
+    )
+
+    filter.filter(record)
+
+    assert 'sk-secret' not in record.msg
+    assert record.msg == "github_token='******'='******'"
+
+
 # --------------------------------------------------------------------------
 # RedactURLParamsFilter tests
 # --------------------------------------------------------------------------
@@ -396,3 +436,21 @@ def test_sensitive_filter_applied_to_handler_catches_child_logger_records():
         'Child logger record was not redacted by handler filter'
     )
     assert '<redacted>' in output
+
+
+def test_strip_ansi_removes_color_codes():
+    colored_text = (
+        '\x1b[92m12:00:00 - openhands:INFO\x1b[0m: hello \x1b[1;31;40mworld\x1b[0m'
+    )
+    assert strip_ansi(colored_text) == '12:00:00 - openhands:INFO: hello world'
+    assert strip_ansi('plain text') == 'plain text'
+
+
+def test_rolling_logger_keeps_last_lines():
+    rolling_logger = RollingLogger(max_lines=3, char_limit=5)
+
+    for line in ['one', 'two', 'three', 'fourteen']:
+        rolling_logger.add_line(line)
+
+    assert list(rolling_logger.log_lines) == ['two', 'three', 'fourt']
+    assert rolling_logger.all_lines == 'one\ntwo\nthree\nfourteen\n'
@@ -1,3 +1,4 @@
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -5,7 +6,10 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from starlette.middleware.cors import CORSMiddleware
 
-from openhands.app_server.middleware import LocalhostCORSMiddleware
+from openhands.app_server.middleware import (
+    InMemoryRateLimiter,
+    LocalhostCORSMiddleware,
+)
 
 
 @pytest.fixture
@@ -150,3 +154,39 @@ def test_localhost_cors_middleware_cors_parameters():
             assert kwargs['allow_credentials'] is True
             assert kwargs['allow_methods'] == ['*']
             assert kwargs['allow_headers'] == ['*']
+
+
+def _make_request(host: str = '127.0.0.1') -> MagicMock:
+    request = MagicMock()
+    request.client.host = host
+    return request
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_requests_within_limit():
+    limiter = InMemoryRateLimiter(requests=2, seconds=1, sleep_seconds=0)
+    request = _make_request()
+
+    assert await limiter(request) is True
+    assert await limiter(request) is True
+    assert await limiter(request) is False
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_drops_expired_requests():
+    limiter = InMemoryRateLimiter(requests=1, seconds=1, sleep_seconds=0)
+    request = _make_request()
+    stale = time.monotonic() - 5
+    limiter.history['127.0.0.1'].extend([stale, stale, stale])
+
+    assert await limiter(request) is True
+    assert len(limiter.history['127.0.0.1']) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_tracks_clients_separately():
+    limiter = InMemoryRateLimiter(requests=1, seconds=1, sleep_seconds=0)
+
+    assert await limiter(_make_request('10.0.0.1')) is True
+    assert await limiter(_make_request('10.0.0.2')) is True
+    assert await limiter(_make_request('10.0.0.1')) is False
@@ -4,9 +4,11 @@ import concurrent.futures
 import pytest
 
 from openhands.app_server.utils.async_utils import (
+    _BACKGROUND_TASKS,
     AsyncException,
     call_async_from_sync,
     call_sync_from_async,
+    create_background_task,
     run_in_loop,
     wait_all,
 )
@@ -339,3 +341,23 @@ def test_run_in_loop_sync_context():
     # Test the function in a synchronous context
     result = sync_function()
     assert result == 24
+
+
+@pytest.mark.asyncio
+async def test_create_background_task_holds_reference_until_done():
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def work():
+        started.set()
+        await release.wait()
+        return 'done'
+
+    task = create_background_task(work())
+    await started.wait()
+    assert task in _BACKGROUND_TASKS
+
+    release.set()
+    assert await task == 'done'
+    await asyncio.sleep(0)
+    assert task not in _BACKGROUND_TASKS